@@ -245,7 +245,8 @@ class Chirotope:
         self._set_entries()
         dual_chirotope = Chirotope(self.ground_set_size - self.rank, self.ground_set_size)
         for rset, value in self._chirotope_dict.items():
-            complement = tuple(i for i in range(self.ground_set_size) if i not in rset)
+            rset_set = set(rset)
+            complement = tuple(i for i in range(self.ground_set_size) if i not in rset_set)
             inversions = sum(i < j for i in rset for j in complement)
             dual_chirotope._set_entry(complement, Sign(-value if inversions & 1 else value)) # check last bit
         return dual_chirotope
@@ -407,7 +408,8 @@ class _ChirotopeFromMinimalSupportElements(Chirotope):
     def _get_adjacent_rsets(self, rset: tuple[int]) -> Iterator[tuple[int]]:
         if self.rank == 0:
             return
-        complement = [i for i in range(self.ground_set_size) if i not in rset]
+        rset_set = set(rset)
+        complement = [i for i in range(self.ground_set_size) if i not in rset_set]
         for subset in Combinations(rset, self.rank - 1):
             for i in complement:
                 yield tuple(sorted(subset + [i]))
@@ -456,11 +458,12 @@ class _ChirotopeFromCircuits(_ChirotopeFromMinimalSupportElements):
         return tuple(sorted(set(rset1).union(rset2)))
 
     def _is_entry_zero(self, rset: list[int]) -> bool:
+        rset_set = set(rset)
         for i in range(self.ground_set_size):
-            if i in rset:
+            if i in rset_set:
                 continue
             face = self._faces_dict[tuple(sorted(rset + [i]))]
-            if set(face.support()).issubset(rset):
+            if rset_set.issuperset(face.support()):
                 return True
         return False
 
@@ -476,8 +479,9 @@ class _ChirotopeFromCocircuits(_ChirotopeFromMinimalSupportElements):
         return tuple(sorted(set(rset1).intersection(rset2)))
 
     def _is_entry_zero(self, rset: list[int]) -> bool:
+        rset_set = set(rset)
         for i in rset:
-            face = self._faces_dict[tuple(sorted(set(rset) - {i}))]
-            if set(rset).issubset(face.zero_support()):
+            face = self._faces_dict[tuple(sorted(rset_set - {i}))]
+            if rset_set.issubset(face.zero_support()):
                 return True
         return False
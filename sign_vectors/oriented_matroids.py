@@ -13,11 +13,13 @@ Oriented matroids
 #  http://www.gnu.org/licenses/                                             #
 #############################################################################
 
+from collections import deque
 from typing import Iterator
 from random import choice
 
 from sage.combinat.combination import Combinations
 from sage.combinat.posets.lattices import LatticePoset
+from sage.data_structures.bitset import FrozenBitset
 from sage.matroids.constructor import Matroid
 from sage.structure.sage_object import SageObject
 
@@ -35,6 +37,9 @@ class _OrientedMatroid(SageObject):
         self._dimension = None
         self._faces_by_dimension: dict[int, set[SignVector]] = {}
         self._loops: set[int] = None
+        self._circuits: set[SignVector] = None
+        self._covectors: set[SignVector] = None
+        self._dual: "_OrientedMatroid" = None
 
         self._connect_faces = True
         self._above: dict[SignVector, set[SignVector]] = {}
@@ -371,9 +376,22 @@ class _OrientedMatroid(SageObject):
         Return the dual oriented matroid.
 
         The dual is determined from the chirotope.
+
+        .. NOTE::
+
+            The result is cached.
+
+        TESTS::
+
+            sage: from sign_vectors import *
+            sage: P = matrix([[1, 2, 0, 0], [0, 1, 2, 3]])
+            sage: om = OrientedMatroid(P)
+            sage: om.dual() is om.dual()
+            True
         """
-        om = _OrientedMatroid.from_chirotope_class(self._chirotope.dual())
-        return om
+        if self._dual is None:
+            self._dual = _OrientedMatroid.from_chirotope_class(self._chirotope.dual())
+        return self._dual
 
     def _set_zero_face(self) -> None:
         r"""Set the zero face of the oriented matroid."""
@@ -407,9 +425,10 @@ class _OrientedMatroid(SageObject):
             (++00)
         """
         element = [0] * self.ground_set_size
+        indices_set = set(indices)
         pos = 0
         for i in range(self.ground_set_size):
-            if i in indices:
+            if i in indices_set:
                 pos += 1
                 continue
             value = self.chirotope_entry(sorted(indices + [i]))
@@ -466,18 +485,20 @@ class _OrientedMatroid(SageObject):
             return
         for indices in Combinations(self.ground_set_size, self.rank - 1):
             try:
-                yield self.cocircuit(indices)
-                yield -self.cocircuit(indices)
+                cocircuit = self.cocircuit(indices)
             except ValueError:
                 continue
+            yield cocircuit
+            yield -cocircuit
 
     def _circuit_generator(self) -> Iterator[SignVector]:
         for indices in Combinations(self.ground_set_size, self.rank + 1):
             try:
-                yield self.circuit(indices)
-                yield -self.circuit(indices)
+                circuit = self.circuit(indices)
             except ValueError:
                 continue
+            yield circuit
+            yield -circuit
 
     def cocircuits(self) -> set[SignVector]:
         r"""
@@ -526,6 +547,10 @@ class _OrientedMatroid(SageObject):
 
         - A set of circuits as sign vectors of this oriented matroid.
 
+        .. NOTE::
+
+            The result is cached.
+
         .. SEEALSO::
 
             - :meth:`circuit`
@@ -538,8 +563,15 @@ class _OrientedMatroid(SageObject):
             sage: om = OrientedMatroid(P)
             sage: om.circuits()
             {(00-+), (+-0+), (-+0-), (00+-), (-+-0), (+-+0)}
+
+        TESTS::
+
+            sage: om.circuits() is om.circuits()
+            True
         """
-        return set(self._circuit_generator())
+        if self._circuits is None:
+            self._circuits = set(self._circuit_generator())
+        return self._circuits
 
     def an_element(self) -> SignVector:
         r"""
@@ -558,15 +590,22 @@ class _OrientedMatroid(SageObject):
 
         The covectors are all elements of this oriented matroid.
 
+        .. NOTE::
+
+            The result is cached.
+
         .. SEEALSO::
 
             - :meth:`cocircuits`
             - :meth:`topes`
             - :meth:`faces`
         """
-        if self._topes_computed():
-            return set().union(*self._all_faces())
-        return self._faces_from_vertices(self.cocircuits())
+        if self._covectors is None:
+            if self._topes_computed():
+                self._covectors = set().union(*self._all_faces())
+            else:
+                self._covectors = self._faces_from_vertices(self.cocircuits())
+        return self._covectors
 
     def elements(self) -> set[SignVector]:
         r"""
@@ -606,7 +645,10 @@ class _OrientedMatroid(SageObject):
             if self.dimension == -1:
                 self._set_zero_face()
             else:
-                self._set_faces(self.dimension, self._topes_from_cocircuits(self.cocircuits()))
+                covectors, topes = self._topes_from_cocircuits(self.cocircuits())
+                if self._covectors is None:
+                    self._covectors = covectors
+                self._set_faces(self.dimension, topes)
         return self._faces_by_dimension[self.dimension]
 
     def faces(self, dimension: int = None) -> set[SignVector] | list[set[SignVector]]:
@@ -680,33 +722,37 @@ class _OrientedMatroid(SageObject):
         """
         return [len(faces) for faces in self._all_faces()]
 
-    def _topes_from_cocircuits(self, cocircuits: set[SignVector]) -> set[SignVector]:
+    def _topes_from_cocircuits(self, cocircuits: set[SignVector]) -> tuple[set[SignVector], set[SignVector]]:
         r"""
         Compute the topes from the cocircuits.
 
         OUTPUT:
-        A set of topes of the oriented matroid.
+        A tuple of the set of all covectors and the set of topes of the oriented matroid.
+        The covectors are a byproduct of the search and are returned to avoid recomputing them.
 
         ALGORITHM:
         This function is based on an algorithm in [Fin01]_.
         """
-        covectors = {zero_sign_vector(self.ground_set_size)}
-        covectors_new = {zero_sign_vector(self.ground_set_size)}
+        zero = zero_sign_vector(self.ground_set_size)
+        covectors = {zero}
+        covectors_new = deque([zero])
         topes = set()
+        # loops are zero in every covector, so topes are recognized by their support size
+        tope_support_size = self.ground_set_size - len(self.loops())
 
         while covectors_new:
-            element1 = covectors_new.pop()
+            element1 = covectors_new.popleft()
             for element2 in cocircuits:
-                if element2 <= element1:
+                if element2.conforms(element1):
                     continue
                 new_element = element2.compose(element1)
                 if new_element not in covectors:
                     covectors.add(new_element)
-                    if set(new_element.zero_support()) == self.loops():
+                    if len(new_element.support()) == tope_support_size:
                         topes.add(new_element)
                     else:
-                        covectors_new.add(new_element)
-        return topes
+                        covectors_new.append(new_element)
+        return covectors, topes
 
     def _topes_computed(self) -> bool:
         return self.dimension in self._faces_by_dimension
@@ -727,17 +773,22 @@ class _OrientedMatroid(SageObject):
         „A graph theoretical approach for reconstruction and generation of oriented matroids“.
         PhD thesis. Zurich: ETH Zurich, 2001. doi: 10.3929/ethz-a-004255224.
         """
-        covectors = {zero_sign_vector(self.ground_set_size)}
-        covectors_new = {zero_sign_vector(self.ground_set_size)}
+        zero = zero_sign_vector(self.ground_set_size)
+        covectors = {zero}
+        covectors_new = deque([zero])
+        # composing with an element of maximal support yields elements of maximal support
+        # which are also reached from elements of smaller support, so they need no expansion
+        maximal_support_size = len(set().union(*(vertex.support() for vertex in vertices)))
         while covectors_new:
-            element1 = covectors_new.pop()
+            element1 = covectors_new.popleft()
             for element2 in vertices:
-                if element2 <= element1:
+                if element2.conforms(element1):
                     continue
                 new_element = element2.compose(element1)
                 if new_element not in covectors:
                     covectors.add(new_element)
-                    covectors_new.add(new_element)
+                    if len(new_element.support()) < maximal_support_size:
+                        covectors_new.append(new_element)
         return covectors
 
     def _lower_faces(self, faces: set[SignVector], connect_faces: bool) -> set[SignVector]:
@@ -767,13 +818,16 @@ class _OrientedMatroid(SageObject):
         """
         output = set()
         for same_support_faces in classes_same_support(faces):
-            p_classes = parallel_classes(same_support_faces, self.ground_set_size)
+            p_classes = [
+                FrozenBitset(parallel_class, capacity=self.ground_set_size)
+                for parallel_class in parallel_classes(same_support_faces, self.ground_set_size)
+            ]
             while same_support_faces:
                 face = same_support_faces.pop()
                 for parallel_class in p_classes:
-                    if all(face[i] == 0 for i in parallel_class):
-                        continue
                     flipped_face = face.flip_signs(parallel_class)
+                    if flipped_face == face:  # face is zero on this parallel class
+                        continue
                     if flipped_face in same_support_faces:
                         lower_face = face.set_to_zero(parallel_class)
                         output.add(lower_face)
@@ -834,7 +888,7 @@ class _OrientedMatroid(SageObject):
             for face in self._faces_by_dimension[1]:
                 connection_count = 0
                 for cocircuit in self.cocircuits():
-                    if cocircuit <= face:
+                    if cocircuit.conforms(face):
                         self._connect(cocircuit, face)
                         connection_count += 1
                         if connection_count == 2: # diamond property
@@ -842,7 +896,7 @@ class _OrientedMatroid(SageObject):
         else:
             for face in self._faces_by_dimension[dimension]:
                 for lower_face in self._faces_by_dimension[dimension - 1]:
-                    if lower_face <= face:
+                    if lower_face.conforms(face):
                         self._connect(lower_face, face)
         self._connected_with_lower_dimension.add(dimension)
 
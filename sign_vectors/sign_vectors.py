@@ -75,6 +75,7 @@ import warnings
 from random import choices
 
 from sage.data_structures.bitset import FrozenBitset
+from sage.misc.cachefunc import cached_function
 from sage.structure.sage_object import SageObject
 from sage.symbolic.ring import SR
 
@@ -138,6 +139,7 @@ def sign_vector(iterable: list[int] | str | SignVector) -> SignVector:
     return SignVector.from_iterable(iterable)
 
 
+@cached_function
 def zero_sign_vector(length: int) -> SignVector:
     r"""
     Return the zero sign vector of a given length.
@@ -146,11 +148,20 @@ def zero_sign_vector(length: int) -> SignVector:
 
     - ``length`` -- length
 
+    .. NOTE::
+
+        The result is cached. Sign vectors are immutable, so the same object can be shared.
+
     EXAMPLES::
 
         sage: from sign_vectors import *
         sage: zero_sign_vector(4)
         (0000)
+
+    TESTS::
+
+        sage: zero_sign_vector(4) is zero_sign_vector(4)
+        True
     """
     return SignVector.zero(length)
 
@@ -574,13 +585,13 @@ class SignVector(SageObject):
         """
         return self * value
 
-    def flip_signs(self, indices: list[int]) -> SignVector:
+    def flip_signs(self, indices: list[int] | FrozenBitset) -> SignVector:
         r"""
         Flips entries of given indices.
 
         INPUT:
 
-        - ``indices`` -- list of indices
+        - ``indices`` -- list of indices or a ``FrozenBitset``
 
         OUTPUT:
         Returns a new sign vector. Components of ``indices`` are multiplied by ``-1``.
@@ -601,17 +612,32 @@ class SignVector(SageObject):
             (+-0+0)
             sage: X.flip_signs([0, 3, 4])
             (--0-0)
+            sage: X.flip_signs(FrozenBitset([0, 3, 4], capacity=5))
+            (--0-0)
+
+        TESTS:
+
+        A mutable ``Bitset`` passed as ``indices`` is not modified::
+
+            sage: X = sign_vector("+0-0")
+            sage: b = Bitset([0, 1, 2], capacity=4)
+            sage: X.flip_signs(b)
+            (-0+0)
+            sage: b
+            1110
         """
-        indices = FrozenBitset(indices) & self._support()
+        if not isinstance(indices, FrozenBitset):
+            indices = FrozenBitset(indices)
+        indices = indices & self._support()
         return self.__class__(self._positive_support ^ indices, self._negative_support ^ indices)
 
-    def set_to_zero(self, indices: list[int]) -> SignVector:
+    def set_to_zero(self, indices: list[int] | FrozenBitset) -> SignVector:
         r"""
         Set given entries to zero.
 
         INPUT:
 
-        - ``indices`` -- list of indices
+        - ``indices`` -- list of indices or a ``FrozenBitset``
 
         OUTPUT:
         Returns a new sign vector of same length. Components with indices in
@@ -633,8 +659,11 @@ class SignVector(SageObject):
             (+-+0+0)
             sage: X.set_to_zero([0, 1, 4])
             (00+000)
+            sage: X.set_to_zero(FrozenBitset([0, 1, 4], capacity=6))
+            (00+000)
         """
-        indices = FrozenBitset(indices)
+        if not isinstance(indices, FrozenBitset):
+            indices = FrozenBitset(indices)
         return self.__class__(self._positive_support - indices, self._negative_support - indices)
 
     def set_to_plus(self, indices: list[int]) -> SignVector:
@@ -898,7 +927,7 @@ class SignVector(SageObject):
             sage: X.conforms(Z)
             True
         """
-        return self._positive_support.issubset(other._positive_support) & self._negative_support.issubset(other._negative_support)
+        return self._positive_support.issubset(other._positive_support) and self._negative_support.issubset(other._negative_support)
 
     def __eq__(self, other: SignVector) -> bool:
         r"""